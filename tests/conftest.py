@@ -0,0 +1,22 @@
+"""Shared fixtures for the FastAPI application tests"""
+
+import pickle
+import pytest
+
+from app import activities
+
+
+@pytest.fixture(scope="session")
+def activities_snapshot():
+    """Pickle the app's initial activities once, before any test mutates them"""
+    return pickle.dumps(activities, protocol=5)
+
+
+@pytest.fixture(autouse=True)
+def reset_activities(activities_snapshot):
+    """Reset activities to initial state after each test"""
+    yield
+
+    # Restore initial state
+    activities.clear()
+    activities.update(pickle.loads(activities_snapshot))
@@ -0,0 +1,63 @@
+"""Benchmarks for the FastAPI application endpoints
+
+Disabled by default via pytest.ini; run with
+``pytest --benchmark-enable --benchmark-only`` to collect timings.
+"""
+
+import pytest
+
+from fastapi.testclient import TestClient
+from app import app, activities
+
+EMAIL = "bench@mergington.edu"
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a synchronous test client, since benchmark() times plain callables"""
+    # Not entered as a context manager, so lifespan events are never run
+    return TestClient(app)
+
+
+def test_bench_get_activities(benchmark, client):
+    """Benchmark GET /activities"""
+    response = benchmark(client.get, "/activities")
+    assert response.status_code == 200
+
+
+def test_bench_signup(benchmark, client):
+    """Benchmark POST /activities/{activity_name}/signup"""
+    participants = activities["Chess Club"]["participants"]
+
+    def setup():
+        # Undo the previous round so every signup succeeds
+        if EMAIL in participants:
+            participants.remove(EMAIL)
+
+    response = benchmark.pedantic(
+        client.post,
+        args=("/activities/Chess Club/signup",),
+        kwargs={"params": {"email": EMAIL}},
+        setup=setup,
+        rounds=200,
+    )
+    assert response.status_code == 200
+
+
+def test_bench_unregister(benchmark, client):
+    """Benchmark DELETE /activities/{activity_name}/unregister"""
+    participants = activities["Chess Club"]["participants"]
+
+    def setup():
+        # Re-add the student so every unregister succeeds
+        if EMAIL not in participants:
+            participants.append(EMAIL)
+
+    response = benchmark.pedantic(
+        client.delete,
+        args=("/activities/Chess Club/unregister",),
+        kwargs={"params": {"email": EMAIL}},
+        setup=setup,
+        rounds=200,
+    )
+    assert response.status_code == 200